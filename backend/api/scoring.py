@@ -26,6 +26,7 @@ from schemas.scoring import (
 )
 from services.scoring_engine import (
     ScoringEngine,
+    SCORING_ENGINE,
     CalibrationEngine,
     extract_severity_factors_from_counterfactual,
     extract_probability_factors_from_counterfactual
@@ -60,7 +61,7 @@ async def compute_scores(
     if request.weights and request.weights.probability_weights:
         engine_kwargs['probability_weights'] = request.weights.probability_weights
 
-    scoring_engine = ScoringEngine(**engine_kwargs)
+    scoring_engine = ScoringEngine(**engine_kwargs) if engine_kwargs else SCORING_ENGINE
 
     scores_computed = []
 
@@ -339,8 +340,7 @@ async def run_monte_carlo(
     probability_factors = extract_probability_factors_from_counterfactual(cf_data)
 
     # Run Monte Carlo simulation
-    scoring_engine = ScoringEngine()
-    simulation_results = scoring_engine.monte_carlo_simulation(
+    simulation_results = SCORING_ENGINE.monte_carlo_simulation(
         severity_factors,
         probability_factors,
         n_simulations=request.n_simulations
@@ -368,8 +368,7 @@ async def get_calibration_statistics(
     # Get weight suggestions if enough data
     weight_suggestions = None
     if len(calibration_engine.adjustments) >= 10:
-        scoring_engine = ScoringEngine()
-        weight_suggestions = calibration_engine.suggest_weight_corrections(scoring_engine)
+        weight_suggestions = calibration_engine.suggest_weight_corrections(SCORING_ENGINE)
 
     return CalibrationStatisticsResponse(
         total_adjustments=stats.get('total_adjustments', 0),
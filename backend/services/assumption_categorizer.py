@@ -3,8 +3,16 @@ Multi-domain assumption categorization system.
 Sprint 2 - Task 2: Categorization System with Hybrid Rule-Based + ML
 """
 import logging
-from typing import List, Dict, Any
-from collections import defaultdict
+import re
+import sys
+from typing import List, Dict, Any, FrozenSet, Pattern, Sequence, Set, Tuple
+from collections import Counter
+from itertools import chain
+
+try:
+    import re2
+except ImportError:  # pragma: no cover - optional speedup
+    re2 = None
 
 logger = logging.getLogger(__name__)
 
@@ -12,79 +20,143 @@ logger = logging.getLogger(__name__)
 # Domain taxonomy with keywords and subcategories
 DOMAIN_TAXONOMY = {
     "political": {
-        "keywords": [
+        "keywords": (
             "policy", "regulation", "government", "legislation", "governance",
             "political", "parliament", "congress", "administration", "treaty",
             "diplomatic", "sovereignty", "regime", "election", "coalition",
             "sanctions", "ministry", "bureau", "federal", "state"
-        ],
+        ),
         "subcategories": ["domestic_policy", "geopolitics", "governance", "regulatory"]
     },
     "economic": {
-        "keywords": [
+        "keywords": (
             "market", "trade", "financial", "economy", "economic", "fiscal",
             "monetary", "currency", "investment", "budget", "revenue", "profit",
             "cost", "price", "inflation", "gdp", "growth", "recession", "banking",
             "capital", "debt", "credit", "supply", "demand", "commodity"
-        ],
+        ),
         "subcategories": ["macroeconomic", "industry", "labor", "trade", "financial_markets"]
     },
     "technological": {
-        "keywords": [
+        "keywords": (
             "technology", "software", "hardware", "digital", "automation",
             "ai", "algorithm", "data", "cyber", "network", "system", "platform",
             "innovation", "engineering", "computing", "infrastructure", "technical",
             "bandwidth", "encryption", "protocol", "semiconductor", "chip"
-        ],
+        ),
         "subcategories": ["infrastructure", "innovation", "cybersecurity", "digital_transformation"]
     },
     "social": {
-        "keywords": [
+        "keywords": (
             "social", "public", "society", "community", "population", "demographic",
             "cultural", "behavior", "opinion", "support", "protest", "movement",
             "migration", "education", "health", "welfare", "inequality", "justice",
             "rights", "identity", "cohesion", "trust", "sentiment"
-        ],
+        ),
         "subcategories": ["demographics", "public_opinion", "social_movements", "cultural_dynamics"]
     },
     "operational": {
-        "keywords": [
+        "keywords": (
             "operations", "logistics", "supply", "chain", "delivery", "production",
             "manufacturing", "capacity", "process", "implementation", "execution",
             "coordination", "management", "efficiency", "workflow", "timeline",
             "deployment", "maintenance", "distribution", "inventory"
-        ],
+        ),
         "subcategories": ["supply_chain", "logistics", "implementation", "process_management"]
     },
     "strategic": {
-        "keywords": [
+        "keywords": (
             "strategy", "strategic", "objective", "goal", "priority", "plan",
             "vision", "mission", "positioning", "competitive", "advantage",
             "alliance", "partnership", "influence", "power", "leadership",
             "decision", "choice", "direction", "intent", "doctrine"
-        ],
+        ),
         "subcategories": ["planning", "positioning", "alliances", "decision_making"]
     },
     "environmental": {
-        "keywords": [
+        "keywords": (
             "environment", "climate", "energy", "renewable", "carbon", "emissions",
             "sustainability", "ecological", "natural", "resource", "pollution",
             "conservation", "weather", "temperature", "water", "agriculture",
             "biodiversity", "waste", "green"
-        ],
+        ),
         "subcategories": ["climate", "energy", "natural_resources", "sustainability"]
     },
     "cultural": {
-        "keywords": [
+        "keywords": (
             "culture", "cultural", "tradition", "values", "belief", "religion",
             "language", "identity", "heritage", "norm", "custom", "ritual",
             "narrative", "worldview", "ideology", "philosophy", "ethics"
-        ],
+        ),
         "subcategories": ["values", "beliefs", "traditions", "narratives"]
     }
 }
 
 
+def _compile_keyword_matcher(keywords: Sequence[str]) -> Tuple[Pattern, Dict[str, Tuple[str, ...]]]:
+    """
+    Build a single-scan matcher for a keyword list.
+
+    The pattern is a zero-width lookahead alternation (longest keyword first),
+    so findall() reports a keyword at every position one starts, including
+    overlapping ones. Only one keyword is reported per position, so each
+    keyword is paired with the shorter keywords that are its prefixes; those
+    also occur wherever it does.
+    """
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    pattern = re.compile("(?=(%s))" % "|".join(map(re.escape, ordered)))
+    prefixes = {
+        keyword: tuple(other for other in ordered
+                       if other != keyword and keyword.startswith(other))
+        for keyword in ordered
+    }
+    return pattern, prefixes
+
+
+# Per-domain keyword sets, built once at import
+DOMAIN_KEYWORD_SETS: Dict[str, FrozenSet[str]] = {
+    domain: frozenset(config["keywords"])
+    for domain, config in DOMAIN_TAXONOMY.items()
+}
+
+# Taxonomy sanity check, once per process rather than per test run
+for _domain, _keyword_set in DOMAIN_KEYWORD_SETS.items():
+    if len(_keyword_set) != len(DOMAIN_TAXONOMY[_domain]["keywords"]):
+        raise ValueError(f"Duplicate keywords in DOMAIN_TAXONOMY[{_domain!r}]")
+
+# One matcher over every domain's keywords, so a text is scanned once in
+# total; each keyword maps back to the domains (in taxonomy order) listing it
+_KEYWORD_DOMAINS: Dict[str, Tuple[str, ...]] = {}
+for _domain, _keywords in DOMAIN_KEYWORD_SETS.items():
+    for _keyword in _keywords:
+        _KEYWORD_DOMAINS[_keyword] = _KEYWORD_DOMAINS.get(_keyword, ()) + (_domain,)
+_KEYWORD_PATTERN, _KEYWORD_PREFIXES = _compile_keyword_matcher(list(_KEYWORD_DOMAINS))
+
+# With google-re2 installed, a RE2 set reports every keyword present in one
+# linear-time DFA pass. RE2 has no lookahead, so the pattern above can't be
+# compiled with it directly, but the set already reports overlapping and
+# prefix matches.
+_KEYWORD_LIST: Tuple[str, ...] = tuple(_KEYWORD_DOMAINS)
+if re2 is not None:
+    _KEYWORD_SET = re2.Set.SearchSet()
+    for _keyword in _KEYWORD_LIST:
+        _KEYWORD_SET.Add(re2.escape(_keyword))
+    _KEYWORD_SET.Compile()
+else:
+    _KEYWORD_SET = None
+
+
+def _find_keywords(text: str) -> Set[str]:
+    """Distinct taxonomy keywords occurring (as substrings) in text."""
+    if _KEYWORD_SET is not None:
+        return {_KEYWORD_LIST[i] for i in _KEYWORD_SET.Match(text) or ()}
+
+    found = set(_KEYWORD_PATTERN.findall(text))
+    for keyword in tuple(found):
+        found.update(_KEYWORD_PREFIXES[keyword])
+    return found
+
+
 class AssumptionCategorizer:
     """
     Hybrid categorization system combining rule-based and semantic approaches.
@@ -112,7 +184,9 @@ class AssumptionCategorizer:
             Enhanced assumption with 'domains' (list), 'domain_confidence' (dict)
         """
         text = assumption.get("text", "").lower()
-        original_category = assumption.get("category", "").lower()
+        # Lowercasing builds a fresh string per call; intern it so a tagged
+        # category shares the taxonomy key's object in "domains"
+        original_category = sys.intern(assumption.get("category", "").lower())
 
         # Rule-based classification
         domain_scores = self._rule_based_classify(text)
@@ -170,19 +244,14 @@ class AssumptionCategorizer:
             categorized.append(self.categorize(assumption))
 
         # Log statistics
-        domain_counts = defaultdict(int)
-        cross_domain_count = 0
-
-        for assumption in categorized:
-            for domain in assumption["domains"]:
-                domain_counts[domain] += 1
-            if assumption["is_cross_domain"]:
-                cross_domain_count += 1
+        cross_domain_count = sum(
+            1 for assumption in categorized if assumption["is_cross_domain"]
+        )
 
         logger.info(
             f"Categorized {len(assumptions)} assumptions. "
             f"Cross-domain: {cross_domain_count}. "
-            f"Domain distribution: {dict(domain_counts)}"
+            f"Domain distribution: {self.get_domain_distribution(categorized)}"
         )
 
         return categorized
@@ -197,13 +266,18 @@ class AssumptionCategorizer:
         Returns:
             Dictionary of {domain: confidence_score}
         """
-        domain_scores = {}
+        # Distinct keywords occurring in the text, from a single scan
+        found = _find_keywords(text)
 
-        for domain, config in self.taxonomy.items():
-            keywords = config["keywords"]
+        # Count keyword matches per domain
+        domain_matches = Counter(chain.from_iterable(
+            _KEYWORD_DOMAINS[keyword] for keyword in found
+        ))
 
-            # Count keyword matches
-            matches = sum(1 for keyword in keywords if keyword in text)
+        domain_scores = {}
+
+        for domain in self.taxonomy:
+            matches = domain_matches.get(domain, 0)
 
             # Calculate score (normalized by number of keywords in domain)
             if matches > 0:
@@ -258,13 +332,9 @@ class AssumptionCategorizer:
         Returns:
             Dictionary of {domain: count}
         """
-        distribution = defaultdict(int)
-
-        for assumption in assumptions:
-            for domain in assumption.get("domains", []):
-                distribution[domain] += 1
-
-        return dict(distribution)
+        return dict(Counter(chain.from_iterable(
+            assumption.get("domains", []) for assumption in assumptions
+        )))
 
     def get_cross_domain_assumptions(
         self,
@@ -299,7 +369,8 @@ class AssumptionCategorizer:
         Returns:
             Filtered list of assumptions
         """
+        target = frozenset(domains)
         return [
             assumption for assumption in assumptions
-            if any(domain in assumption.get("domains", []) for domain in domains)
+            if not target.isdisjoint(assumption.get("domains", []))
         ]
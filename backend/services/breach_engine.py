@@ -9,7 +9,6 @@ from typing import List, Dict, Optional, Tuple
 import json
 import logging
 from datetime import datetime
-import asyncio
 
 from services.llm_provider import LLMProvider
 from services.axis_framework import (
@@ -18,6 +17,7 @@ from services.axis_framework import (
     get_prompt_for_axis,
     StrategicAxis
 )
+from utils.concurrency import gather_settled
 
 logger = logging.getLogger(__name__)
 
@@ -419,21 +419,29 @@ async def generate_all_breaches(
         Dictionary mapping fragility IDs to breach condition lists
     """
     engine = BreachConditionEngine(llm_provider)
-    breach_map = {}
 
-    for fragility in fragilities:
-        fragility_id = fragility.get("id")
-        try:
-            breaches = await engine.generate_breach_conditions(
+    # Fragilities are independent, so issue all LLM calls concurrently
+    fragility_ids = [fragility.get("id") for fragility in fragilities]
+    results = await gather_settled(
+        (
+            engine.generate_breach_conditions(
                 fragility=fragility,
                 scenario_context=scenario_context,
                 max_breaches=4
             )
-            breach_map[fragility_id] = breaches
-            logger.info(f"Generated {len(breaches)} breaches for fragility {fragility_id}")
-        except Exception as e:
-            logger.error(f"Failed to generate breaches for {fragility_id}: {e}")
+            for fragility in fragilities
+        ),
+        fragility_ids,
+        "generate breaches"
+    )
+
+    breach_map: Dict[Optional[str], List[Dict]] = {}
+    for fragility_id, result in zip(fragility_ids, results):
+        if result is None:
             breach_map[fragility_id] = []
+        else:
+            breach_map[fragility_id] = result
+            logger.info(f"Generated {len(result)} breaches for fragility {fragility_id}")
 
     return breach_map
 
@@ -2,11 +2,13 @@
 Export and formatting system for assumptions and analysis results.
 Sprint 2 - Task 4: Multi-Format Serialization Pipeline
 """
-import json
 import logging
+from collections import defaultdict
 from typing import Dict, Any, List
 from datetime import datetime
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
@@ -86,7 +88,12 @@ class ExportFormatter:
         if narrative:
             export_data["baseline_narrative"] = narrative
 
-        return json.dumps(export_data, indent=2)
+        # 2-space layout; non-ASCII text is UTF-8, UUIDs and datetimes are
+        # strings, NaN/Infinity are null
+        return orjson.dumps(
+            export_data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
 
     def export_markdown(
         self,
@@ -312,15 +319,10 @@ class ExportFormatter:
         assumptions: List[Dict[str, Any]]
     ) -> Dict[str, List[Dict[str, Any]]]:
         """Group assumptions by domain (primary domain)."""
-        groups = {}
+        groups = defaultdict(list)
 
         for assumption in assumptions:
             domains = assumption.get("domains", ["unknown"])
-            primary_domain = domains[0]
-
-            if primary_domain not in groups:
-                groups[primary_domain] = []
+            groups[domains[0]].append(assumption)
 
-            groups[primary_domain].append(assumption)
-
-        return groups
+        return dict(groups)
@@ -2,15 +2,41 @@
 LLM Provider abstraction layer supporting multiple providers.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
+import json
 import anthropic
 import openai
 from utils.config import settings
 import logging
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def parse_llm_json(content: Union[str, bytes]) -> Union[Dict[str, Any], List[Any]]:
+    """
+    Parse a JSON payload returned by an LLM.
+
+    Accepts the decoded text or the raw UTF-8 response body. Uses orjson
+    when installed and falls back to the stdlib parser. Both raise
+    json.JSONDecodeError (orjson's error subclasses it) on malformed input;
+    the stdlib parser raises UnicodeDecodeError for bytes that are not valid
+    UTF-8. Payloads that are valid JSON but not an object or array (e.g.
+    "null") are rejected as a decode error, since callers expect structured
+    output.
+    """
+    result = orjson.loads(content) if orjson is not None else json.loads(content)
+    if not isinstance(result, (dict, list)):
+        if isinstance(content, bytes):
+            content = content.decode("utf-8", errors="replace")
+        raise json.JSONDecodeError("Expected a JSON object or array", content, 0)
+    return result
+
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
@@ -6,6 +6,8 @@ import re
 import logging
 from typing import Dict, Any, List
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,6 +28,51 @@ SYSTEMIC_KEYWORDS = {
     "network", "interconnected", "interdependent", "linked"
 }
 
+# Subjective language that reduces verifiability score
+SUBJECTIVE_TERMS = frozenset({
+    "believe", "feel", "think", "seem", "appear",
+    "good", "bad", "better", "worse", "best", "worst"
+})
+
+# Conditional language (substring match) that reduces verifiability score
+CONDITIONAL_TERMS = ("if", "unless", "provided", "assuming", "suppose")
+
+# Scope indicators that increase impact score
+SCOPE_INDICATORS = frozenset({
+    "all", "every", "entire", "global", "national", "widespread",
+    "multiple", "across", "throughout"
+})
+
+# Negative framing (substring match) that increases impact score
+NEGATIVE_TERMS = ("fail", "failure", "collapse", "crisis", "disruption", "breakdown")
+
+# Precompiled patterns for the per-assumption dimension scorers
+_NUMBER_RE = re.compile(r'\d+')
+_PERCENTAGE_RE = re.compile(r'\d+%')
+_DATE_RE = re.compile(
+    r'\d{4}|january|february|march|april|may|june|july|august|september|october|november|december'
+)
+_CAPITALIZED_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+_MEASURABLE_RE = re.compile(r'\d+%|\d+\s*(percent|times|fold)')
+
+# Priority tiers in batch sort order; score_batch ranks by position here
+PRIORITY_TIERS = ("high", "needs_review", "medium", "low")
+
+# Verifiable language patterns; each one present adds to the score
+VERIFIABLE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'will\s+\w+',  # Future predictions
+    r'can\s+be\s+\w+',  # Observable capabilities
+    r'results?\s+in',  # Causal claims
+    r'leads?\s+to',
+    r'causes?',
+    r'enables?',
+    r'prevents?',
+    r'increases?',
+    r'decreases?',
+    r'improves?',
+    r'reduces?'
+))
+
 
 class QualityScore:
     """Quality score result with dimensions."""
@@ -78,18 +125,10 @@ class AssumptionQualityScorer:
         Returns:
             QualityScore object with composite score and dimensions
         """
-        text = assumption.get("text", "")
-        domains = assumption.get("domains", [])
         confidence = assumption.get("confidence", 0.5)
-        source_excerpt = assumption.get("source_excerpt", "")
 
         # Calculate dimensional scores
-        scores = {
-            "specificity": self._score_specificity(text),
-            "verifiability": self._score_verifiability(text),
-            "impact_potential": self._score_impact(text, domains),
-            "source_strength": self._score_source(source_excerpt)
-        }
+        scores = self._score_dimensions(assumption)
 
         # Weighted composite score
         composite = (
@@ -115,35 +154,50 @@ class AssumptionQualityScorer:
         """
         Score a batch of assumptions and add quality metadata.
 
+        Dimension scores are computed per assumption, then packed into
+        columns so the composite and tier are computed by
+        score_batch_columnar() / assign_tiers_columnar().
+
         Args:
             assumptions: List of assumption dicts
 
         Returns:
             List of assumptions enhanced with quality_score dict
         """
-        scored = []
-
-        for assumption in assumptions:
-            quality = self.score(assumption)
-            assumption["quality_score"] = quality.composite
-            assumption["quality_dimensions"] = quality.dimensions
-            assumption["priority_tier"] = quality.priority_tier
-            scored.append(assumption)
-
-        # Sort by priority
-        scored.sort(
-            key=lambda a: (
-                0 if a["priority_tier"] == "high" else
-                1 if a["priority_tier"] == "needs_review" else
-                2 if a["priority_tier"] == "medium" else 3
-            )
+        n = len(assumptions)
+        dimensions = [self._score_dimensions(assumption) for assumption in assumptions]
+
+        def column(key: str) -> np.ndarray:
+            return np.fromiter((d[key] for d in dimensions), dtype=np.float64, count=n)
+
+        composite = self.score_batch_columnar(
+            column("specificity"),
+            column("verifiability"),
+            column("impact_potential"),
+            column("source_strength")
         )
+        confidence = np.fromiter(
+            (assumption.get("confidence", 0.5) for assumption in assumptions),
+            dtype=np.float64, count=n
+        )
+        tier_codes = self.assign_tiers_columnar(composite, confidence)
+
+        for assumption, dims, score, code in zip(
+            assumptions, dimensions, composite.tolist(), tier_codes.tolist()
+        ):
+            assumption["quality_score"] = score
+            assumption["quality_dimensions"] = dims
+            assumption["priority_tier"] = PRIORITY_TIERS[code]
+
+        # Sort by priority (stable, so ties keep input order)
+        order = np.argsort(tier_codes, kind="stable")
+        scored = [assumptions[i] for i in order.tolist()]
 
         # Log statistics
-        tier_counts = {}
-        for assumption in scored:
-            tier = assumption["priority_tier"]
-            tier_counts[tier] = tier_counts.get(tier, 0) + 1
+        counts = np.bincount(tier_codes, minlength=len(PRIORITY_TIERS))
+        tier_counts = {
+            tier: int(count) for tier, count in zip(PRIORITY_TIERS, counts) if count
+        }
 
         logger.info(
             f"Scored {len(assumptions)} assumptions. "
@@ -152,6 +206,85 @@ class AssumptionQualityScorer:
 
         return scored
 
+    @staticmethod
+    def score_batch_columnar(
+        specificity: np.ndarray,
+        verifiability: np.ndarray,
+        impact_potential: np.ndarray,
+        source_strength: np.ndarray
+    ) -> np.ndarray:
+        """
+        Weighted composite score for a batch of dimension-score columns.
+
+        Uses the same weights and operation order as score(), so each
+        element equals the composite score() gives for that assumption.
+
+        Args:
+            specificity: Specificity scores (0-100), one per assumption
+            verifiability: Verifiability scores (0-100)
+            impact_potential: Impact potential scores (0-100)
+            source_strength: Source strength scores (0-100)
+
+        Returns:
+            float64 array of composite scores
+        """
+        return (
+            np.asarray(specificity, dtype=np.float64) * 0.25 +
+            np.asarray(verifiability, dtype=np.float64) * 0.25 +
+            np.asarray(impact_potential, dtype=np.float64) * 0.35 +
+            np.asarray(source_strength, dtype=np.float64) * 0.15
+        )
+
+    @staticmethod
+    def assign_tiers_columnar(
+        composite: np.ndarray,
+        confidence: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized _assign_tier() for a batch.
+
+        Args:
+            composite: Composite quality scores (0-100)
+            confidence: Extraction confidences (0-1)
+
+        Returns:
+            int array of indices into PRIORITY_TIERS
+        """
+        composite = np.asarray(composite, dtype=np.float64)
+        confidence = np.asarray(confidence, dtype=np.float64)
+        # Conditions are checked in the same precedence as _assign_tier()
+        return np.select(
+            [
+                confidence < 0.5,
+                (composite >= 70) & (confidence >= 0.7),
+                composite >= 40
+            ],
+            [
+                PRIORITY_TIERS.index("needs_review"),
+                PRIORITY_TIERS.index("high"),
+                PRIORITY_TIERS.index("medium")
+            ],
+            default=PRIORITY_TIERS.index("low")
+        ).astype(np.intp)
+
+    def _score_dimensions(self, assumption: Dict[str, Any]) -> Dict[str, float]:
+        """
+        Calculate the four dimension scores for an assumption.
+
+        Args:
+            assumption: Assumption dict with text, domains, source_excerpt
+
+        Returns:
+            Dictionary of {dimension: score}
+        """
+        text = assumption.get("text", "")
+        return {
+            "specificity": self._score_specificity(text),
+            "verifiability": self._score_verifiability(text),
+            "impact_potential": self._score_impact(text, assumption.get("domains", [])),
+            "source_strength": self._score_source(assumption.get("source_excerpt", ""))
+        }
+
     def _score_specificity(self, text: str) -> float:
         """
         Score specificity: higher for quantifiable, specific claims.
@@ -167,9 +300,9 @@ class AssumptionQualityScorer:
         text_lower = text.lower()
 
         # Check for numbers, dates, percentages
-        has_numbers = bool(re.search(r'\d+', text))
-        has_percentage = bool(re.search(r'\d+%', text))
-        has_date = bool(re.search(r'\d{4}|january|february|march|april|may|june|july|august|september|october|november|december', text_lower))
+        has_numbers = bool(_NUMBER_RE.search(text))
+        has_percentage = bool(_PERCENTAGE_RE.search(text))
+        has_date = bool(_DATE_RE.search(text_lower))
 
         if has_numbers:
             score += 15
@@ -179,7 +312,7 @@ class AssumptionQualityScorer:
             score += 10
 
         # Check for specific entities (simple heuristic: capitalized words)
-        capitalized_words = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', text)
+        capitalized_words = _CAPITALIZED_RE.findall(text)
         named_entities = len(set(capitalized_words))
         score += min(named_entities * 5, 25)
 
@@ -211,39 +344,20 @@ class AssumptionQualityScorer:
         text_lower = text.lower()
 
         # Look for verifiable language patterns
-        verifiable_patterns = [
-            r'will\s+\w+',  # Future predictions
-            r'can\s+be\s+\w+',  # Observable capabilities
-            r'results?\s+in',  # Causal claims
-            r'leads?\s+to',
-            r'causes?',
-            r'enables?',
-            r'prevents?',
-            r'increases?',
-            r'decreases?',
-            r'improves?',
-            r'reduces?'
-        ]
-
-        for pattern in verifiable_patterns:
-            if re.search(pattern, text_lower):
+        for pattern in VERIFIABLE_PATTERNS:
+            if pattern.search(text_lower):
                 score += 10
 
         # Check for measurable outcomes
-        if re.search(r'\d+%|\d+\s*(percent|times|fold)', text_lower):
+        if _MEASURABLE_RE.search(text_lower):
             score += 15
 
         # Penalize subjective language
-        subjective_terms = {
-            "believe", "feel", "think", "seem", "appear",
-            "good", "bad", "better", "worse", "best", "worst"
-        }
-        subjective_count = sum(1 for word in text_lower.split() if word in subjective_terms)
+        subjective_count = sum(1 for word in text_lower.split() if word in SUBJECTIVE_TERMS)
         score -= subjective_count * 8
 
         # Check for conditional language (reduces verifiability)
-        conditional_terms = {"if", "unless", "provided", "assuming", "suppose"}
-        if any(term in text_lower for term in conditional_terms):
+        if any(term in text_lower for term in CONDITIONAL_TERMS):
             score -= 10
 
         return max(0, min(100, score))
@@ -275,16 +389,11 @@ class AssumptionQualityScorer:
         score += min(systemic_count * 10, 30)
 
         # Scope indicators
-        scope_indicators = {
-            "all", "every", "entire", "global", "national", "widespread",
-            "multiple", "across", "throughout"
-        }
-        scope_count = sum(1 for word in text_lower.split() if word in scope_indicators)
+        scope_count = sum(1 for word in text_lower.split() if word in SCOPE_INDICATORS)
         score += min(scope_count * 5, 15)
 
         # Negative framing (risks often more impactful)
-        negative_terms = {"fail", "failure", "collapse", "crisis", "disruption", "breakdown"}
-        if any(term in text_lower for term in negative_terms):
+        if any(term in text_lower for term in NEGATIVE_TERMS):
             score += 10
 
         return max(0, min(100, score))
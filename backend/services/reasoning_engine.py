@@ -4,7 +4,7 @@ Core reasoning engine for multi-phase structured analysis.
 import json
 import logging
 from typing import List, Dict, Any
-from services.llm_provider import get_llm_provider
+from services.llm_provider import get_llm_provider, parse_llm_json
 from utils.prompts import PromptLibrary, REASONING_SYSTEM_PROMPT
 
 logger = logging.getLogger(__name__)
@@ -51,7 +51,7 @@ class ReasoningEngine:
             elif "```" in content:
                 content = content.split("```")[1].split("```")[0]
 
-            result = json.loads(content.strip())
+            result = parse_llm_json(content.strip())
             assumptions = result.get("assumptions", [])
 
             logger.info(f"Extracted {len(assumptions)} assumptions")
@@ -145,7 +145,7 @@ class ReasoningEngine:
             elif "```" in content:
                 content = content.split("```")[1].split("```")[0]
 
-            result = json.loads(content.strip())
+            result = parse_llm_json(content.strip())
             questions = result.get("questions", [])
 
             logger.info(f"Generated {len(questions)} probing questions")
@@ -201,7 +201,7 @@ class ReasoningEngine:
             elif "```" in content:
                 content = content.split("```")[1].split("```")[0]
 
-            result = json.loads(content.strip())
+            result = parse_llm_json(content.strip())
             counterfactuals = result.get("counterfactuals", [])
 
             logger.info(f"Generated {len(counterfactuals)} counterfactuals")
@@ -256,7 +256,7 @@ class ReasoningEngine:
             elif "```" in content:
                 content = content.split("```")[1].split("```")[0]
 
-            result = json.loads(content.strip())
+            result = parse_llm_json(content.strip())
 
             logger.info(f"Generated strategic outcome for axis: {axis}")
             return result
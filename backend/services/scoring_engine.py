@@ -6,15 +6,16 @@ with confidence interval calculation using bootstrap resampling and
 Monte Carlo simulation.
 """
 import numpy as np
-from typing import Dict, Tuple, List, Optional
-from dataclasses import dataclass
+from copy import deepcopy
+from typing import Dict, Tuple, List, Optional, Sequence, Union
+from dataclasses import dataclass, fields, astuple
 from scipy import stats
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SeverityFactors:
     """Factors contributing to severity score (0-1 normalized)."""
     cascade_depth: float  # Number of consequence layers
@@ -30,7 +31,7 @@ class SeverityFactors:
                 raise ValueError(f"{field} must be between 0 and 1, got {value}")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProbabilityFactors:
     """Factors contributing to probability score (0-1 normalized)."""
     fragility_strength: float  # Evidence strength of vulnerability
@@ -55,6 +56,31 @@ class ScoreResult:
     sensitivity: Dict[str, float]  # Factor influence scores
 
 
+def dataclass_to_matrix(
+    factors_list: Sequence[Union[SeverityFactors, ProbabilityFactors]]
+) -> np.ndarray:
+    """
+    Pack a list of factor dataclasses into an (N, n_factors) float matrix.
+
+    Columns follow the dataclass field order, which is the layout expected
+    by the batch scoring methods on ScoringEngine.
+
+    Args:
+        factors_list: SeverityFactors or ProbabilityFactors instances (one type)
+
+    Returns:
+        Float64 array of shape (N, n_factors)
+    """
+    if not factors_list:
+        return np.empty((0, 4))
+
+    names = [f.name for f in fields(factors_list[0])]
+    return np.array(
+        [[getattr(factors, name) for name in names] for factors in factors_list],
+        dtype=np.float64
+    )
+
+
 class ScoringEngine:
     """
     Multi-factor scoring engine for counterfactual scenarios.
@@ -78,6 +104,9 @@ class ScoringEngine:
         'time_horizon': 0.15
     }
 
+    # Max distinct factor sets kept by the Monte Carlo result cache
+    MC_CACHE_SIZE = 1024
+
     def __init__(
         self,
         severity_weights: Optional[Dict[str, float]] = None,
@@ -105,10 +134,24 @@ class ScoringEngine:
         self._validate_weights(self.severity_weights, "severity")
         self._validate_weights(self.probability_weights, "probability")
 
+        # Weight vectors in dataclass field order for batch (matrix) scoring;
+        # a factor left out of custom weights contributes nothing (weight 0)
+        self._sev_weights = np.array(
+            [self.severity_weights.get(f.name, 0.0) for f in fields(SeverityFactors)]
+        )
+        self._prob_weights = np.array(
+            [self.probability_weights.get(f.name, 0.0) for f in fields(ProbabilityFactors)]
+        )
+
         # Set random seed
         if random_seed is not None:
             np.random.seed(random_seed)
 
+        # Monte Carlo uses its own seeded generator so identical factor inputs
+        # give reproducible (and therefore cacheable) distributions
+        self._rng = np.random.default_rng(42 if random_seed is None else random_seed)
+        self._mc_cache: Dict[tuple, Dict] = {}
+
     def _validate_weights(self, weights: Dict[str, float], name: str):
         """Validate that weights sum to approximately 1.0."""
         total = sum(weights.values())
@@ -126,10 +169,7 @@ class ScoringEngine:
             ScoreResult with score, CI, factors, and sensitivity
         """
         # Calculate base score
-        score = sum(
-            getattr(factors, factor) * weight
-            for factor, weight in self.severity_weights.items()
-        )
+        score = float(self.calculate_severity_batch(dataclass_to_matrix([factors]))[0])
 
         # Calculate confidence interval using bootstrap
         ci = self._bootstrap_confidence_interval(factors, self.severity_weights)
@@ -161,10 +201,7 @@ class ScoringEngine:
             ScoreResult with score, CI, factors, and sensitivity
         """
         # Calculate base score
-        score = sum(
-            getattr(factors, factor) * weight
-            for factor, weight in self.probability_weights.items()
-        )
+        score = float(self.calculate_probability_batch(dataclass_to_matrix([factors]))[0])
 
         # Calculate confidence interval using bootstrap
         ci = self._bootstrap_confidence_interval(factors, self.probability_weights)
@@ -185,6 +222,44 @@ class ScoringEngine:
             sensitivity=sensitivity
         )
 
+    def calculate_severity_batch(self, factors_matrix: np.ndarray) -> np.ndarray:
+        """
+        Calculate severity scores for many factor sets in one pass.
+
+        Args:
+            factors_matrix: (N, 4) array with columns in SeverityFactors field
+                order (see dataclass_to_matrix)
+
+        Returns:
+            (N,) array of severity scores
+        """
+        return self._score_matrix(factors_matrix, self._sev_weights)
+
+    def calculate_probability_batch(self, factors_matrix: np.ndarray) -> np.ndarray:
+        """
+        Calculate probability scores for many factor sets in one pass.
+
+        Args:
+            factors_matrix: (N, 4) array with columns in ProbabilityFactors field
+                order (see dataclass_to_matrix)
+
+        Returns:
+            (N,) array of probability scores
+        """
+        return self._score_matrix(factors_matrix, self._prob_weights)
+
+    def _score_matrix(self, factors_matrix: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """Validate a factor matrix and apply the weight vector (single matmul)."""
+        factors_matrix = np.asarray(factors_matrix, dtype=np.float64)
+        if factors_matrix.ndim != 2 or factors_matrix.shape[1] != len(weights):
+            raise ValueError(
+                f"factors_matrix must have shape (N, {len(weights)}), "
+                f"got {factors_matrix.shape}"
+            )
+        if ((factors_matrix < 0) | (factors_matrix > 1)).any():
+            raise ValueError("All factors must be between 0 and 1")
+        return factors_matrix @ weights
+
     def _bootstrap_confidence_interval(
         self,
         factors: any,
@@ -271,9 +346,13 @@ class ScoringEngine:
         Returns:
             Dictionary with simulation statistics
         """
-        severity_scores = []
-        probability_scores = []
-        risk_scores = []  # severity × probability
+        key = (
+            tuple(round(f, 3) for f in astuple(severity_factors) + astuple(probability_factors)),
+            n_simulations
+        )
+        cached = self._mc_cache.get(key)
+        if cached is not None:
+            return deepcopy(cached)
 
         # Get factor arrays
         sev_values = np.array([getattr(severity_factors, f) for f in self.severity_weights.keys()])
@@ -281,24 +360,20 @@ class ScoringEngine:
         sev_weights = np.array(list(self.severity_weights.values()))
         prob_weights = np.array(list(self.probability_weights.values()))
 
-        for _ in range(n_simulations):
-            # Add noise to simulate uncertainty
-            sev_noise = np.random.normal(0, 0.05, size=len(sev_values))
-            prob_noise = np.random.normal(0, 0.05, size=len(prob_values))
-
-            sev_perturbed = np.clip(sev_values + sev_noise, 0, 1)
-            prob_perturbed = np.clip(prob_values + prob_noise, 0, 1)
-
-            # Calculate scores
-            sev_score = np.dot(sev_perturbed, sev_weights)
-            prob_score = np.dot(prob_perturbed, prob_weights)
-            risk_score = sev_score * prob_score
+        # Add noise to simulate uncertainty (one row per simulation run)
+        sev_perturbed = np.clip(
+            sev_values + self._rng.normal(0, 0.05, size=(n_simulations, len(sev_values))), 0, 1
+        )
+        prob_perturbed = np.clip(
+            prob_values + self._rng.normal(0, 0.05, size=(n_simulations, len(prob_values))), 0, 1
+        )
 
-            severity_scores.append(sev_score)
-            probability_scores.append(prob_score)
-            risk_scores.append(risk_score)
+        # Calculate scores
+        severity_scores = sev_perturbed @ sev_weights
+        probability_scores = prob_perturbed @ prob_weights
+        risk_scores = severity_scores * probability_scores  # severity × probability
 
-        return {
+        results = {
             'severity': {
                 'mean': float(np.mean(severity_scores)),
                 'std': float(np.std(severity_scores)),
@@ -334,6 +409,15 @@ class ScoringEngine:
             }
         }
 
+        if len(self._mc_cache) >= self.MC_CACHE_SIZE:
+            self._mc_cache.pop(next(iter(self._mc_cache)))
+        self._mc_cache[key] = results
+        return deepcopy(results)
+
+
+# Shared default-weight engine (stateless apart from its Monte Carlo cache)
+SCORING_ENGINE = ScoringEngine()
+
 
 class CalibrationEngine:
     """
@@ -36,9 +36,11 @@ from services.breach_engine import BreachConditionGenerator
 from services.counterfactual_generator import CounterfactualGenerator
 from services.scoring_engine import (
     ScoringEngine,
+    SCORING_ENGINE,
     extract_severity_factors_from_counterfactual,
     extract_probability_factors_from_counterfactual
 )
+from utils.concurrency import gather_settled
 from utils.config import settings
 
 logger = logging.getLogger(__name__)
@@ -191,17 +193,14 @@ def phase3_generation_pipeline(
                 )
                 tasks.append(task)
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            breaches_dict = {}
-            for fragility, result in zip(fragilities, results):
-                if isinstance(result, Exception):
-                    logger.error(f"Failed to generate breaches for {fragility.id}: {result}")
-                    breaches_dict[str(fragility.id)] = []
-                else:
-                    breaches_dict[str(fragility.id)] = result
+            results = await gather_settled(
+                tasks, [fragility.id for fragility in fragilities], "generate breaches"
+            )
 
-            return breaches_dict
+            return {
+                str(fragility.id): [] if result is None else result
+                for fragility, result in zip(fragilities, results)
+            }
 
         all_breaches = loop.run_until_complete(generate_all_breaches())
 
@@ -261,16 +260,14 @@ def phase3_generation_pipeline(
                 )
                 tasks.append((breach, task))
 
-            results = []
-            for breach, task in tasks:
-                try:
-                    result = await task
-                    results.append((breach, result))
-                except Exception as e:
-                    logger.error(f"Failed to generate counterfactual for breach {breach.id}: {e}")
-                    results.append((breach, None))
+            outcomes = await gather_settled(
+                (task for _, task in tasks),
+                [f"breach {breach.id}" for breach, _ in tasks],
+                "generate counterfactual"
+            )
 
-            return results
+            # Failed breaches come back as (breach, None) and are skipped below
+            return [(breach, result) for (breach, _), result in zip(tasks, outcomes)]
 
         cf_results = loop.run_until_complete(generate_all_counterfactuals())
 
@@ -315,7 +312,7 @@ def phase3_generation_pipeline(
                 probability_weights=custom_scoring_weights.get('probability')
             )
         else:
-            scoring_engine = ScoringEngine()
+            scoring_engine = SCORING_ENGINE
 
         score_models = []
         for counterfactual, cf_data in counterfactual_models:
@@ -0,0 +1,44 @@
+"""
+Helpers for fanning out independent async work (e.g. one LLM call per item).
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Iterable, List, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+async def gather_settled(
+    awaitables: Iterable[Awaitable[T]],
+    labels: Sequence[Any],
+    action: str
+) -> List[Optional[T]]:
+    """
+    Run awaitables concurrently, isolating per-item failures.
+
+    A failed item is logged and comes back as None, so one bad LLM call
+    doesn't sink the batch. Cancellation is not an item failure: a
+    CancelledError is re-raised.
+
+    Args:
+        awaitables: One awaitable per item
+        labels: Item labels (e.g. ids) for log messages, aligned with awaitables
+        action: What is being done, for log messages (e.g. "generate breaches")
+
+    Returns:
+        Results in input order, with None for failed items
+    """
+    results = await asyncio.gather(*awaitables, return_exceptions=True)
+
+    settled: List[Optional[T]] = []
+    for label, result in zip(labels, results):
+        if isinstance(result, asyncio.CancelledError):
+            raise result
+        if isinstance(result, BaseException):
+            logger.error(f"Failed to {action} for {label}: {result}")
+            settled.append(None)
+        else:
+            settled.append(result)
+    return settled
@@ -1,10 +1,94 @@
 """
 Quality Evaluation Rubrics for Output Validation
 Systematic scoring of assumptions, questions, and counterfactuals
+
+The module is fully annotated so it can be compiled with mypyc for large
+scoring runs (`mypyc tests/quality_rubrics.py`); the pure-Python source is
+what the test suite imports by default.
 """
-from typing import List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Pattern, Sequence, Set, Tuple
+import hashlib
+import json
 import re
 
+import numpy as np
+
+# Quantifiable/measurable statements: percentages, dollar amounts, time
+# periods and change verbs, fused into one alternation (single scan per text)
+_VERIFIABLE_RE = re.compile(
+    r'\d+%'
+    r'|\$\d+'
+    r'|\d+\s*(?:year|month|day|week)'
+    r'|increase|decrease|grow|shrink|rise|fall'
+)
+
+# Indicator phrases (substring matches on lowercased text)
+VAGUE_WORDS = ('might', 'could', 'possibly', 'generally', 'usually',
+               'maybe', 'perhaps', 'sometimes', 'often')
+DEEP_INDICATORS = ('why', 'how', 'what if', 'under what conditions',
+                   'what would happen', 'what prevents', 'what enables')
+ACTIONABLE_PATTERNS = ('impact', 'effect', 'consequence', 'result', 'outcome',
+                       'change', 'alter', 'affect', 'influence')
+PLAUSIBLE_INDICATORS = ('if', 'when', 'given', 'assuming', 'should',
+                        'were to', 'in case of')
+
+
+# Counterfactual specificity: breach condition of at least 10 words. Matching
+# stops at the start of the 10th word instead of splitting the whole text.
+_MIN_BREACH_WORDS = 10
+_MIN_BREACH_WORDS_RE = re.compile(r'\s*(?:\S+\s+){%d}\S' % (_MIN_BREACH_WORDS - 1))
+
+
+def _has_min_words(text: str) -> bool:
+    """True if text has at least _MIN_BREACH_WORDS whitespace-separated words."""
+    return _MIN_BREACH_WORDS_RE.match(text) is not None
+
+
+# Coverage targets for the completeness/coverage/diversity metrics
+_EXPECTED_DOMAINS = frozenset({'political', 'economic', 'operational', 'social',
+                               'technical', 'environmental'})
+_EXPECTED_DIMENSIONS = frozenset({'temporal', 'structural', 'actor', 'resource',
+                                  'information'})
+_EXPECTED_AXES = frozenset({'escalation', 'containment', 'diplomatic',
+                            'economic', 'internal', 'wildcard'})
+
+
+def _trie_pattern(phrases: Sequence[str]) -> str:
+    """Regex source matching any of phrases, with shared prefixes factored out"""
+    if '' in phrases:
+        # A phrase ends here; longer ones sharing this prefix can't change
+        # whether the text contains a match, so they are dropped
+        return ''
+    branches: Dict[str, List[str]] = {}
+    for phrase in phrases:
+        branches.setdefault(phrase[0], []).append(phrase[1:])
+    alternatives = [re.escape(first) + _trie_pattern(tails)
+                    for first, tails in sorted(branches.items())]
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return '(?:%s)' % '|'.join(alternatives)
+
+
+def _any_phrase_re(phrases: Sequence[str]) -> Pattern[str]:
+    """
+    Compile phrases into one prefix-trie alternation: a text is scanned once,
+    and at each position only phrases sharing the current prefix are tried
+    (e.g. 'what if|what would happen' becomes 'what (?:if|would happen)').
+    Only meant for "does the text contain any phrase" tests.
+    """
+    return re.compile(_trie_pattern(sorted(set(phrases))))
+
+
+# Batches smaller than this are scored in-process; worker startup and
+# pickling would cost more than the scoring itself
+_PARALLEL_MIN_BATCH = 64
+
+_VAGUE_RE = _any_phrase_re(VAGUE_WORDS)
+_DEEP_RE = _any_phrase_re(DEEP_INDICATORS)
+_ACTIONABLE_RE = _any_phrase_re(ACTIONABLE_PATTERNS)
+_PLAUSIBLE_RE = _any_phrase_re(PLAUSIBLE_INDICATORS)
+
 
 class QualityRubric:
     """Automated quality scoring for reasoning outputs"""
@@ -18,56 +102,68 @@ class QualityRubric:
         if not assumptions:
             return 0.0
 
-        scores = {
+        scores: Dict[str, float] = {
             'specificity': 0.0,
             'verifiability': 0.0,
             'completeness': 0.0,
             'accuracy': 0.0
         }
 
-        # 1. Specificity: Avoid vague language
-        vague_words = ['might', 'could', 'possibly', 'generally', 'usually',
-                       'maybe', 'perhaps', 'sometimes', 'often']
+        # Single pass over assumptions, accumulating all four metrics
         specific_count = 0
+        verifiable_count = 0
+        accurate_count = 0
+        domains: Set[str] = set()
+        # Resolve the per-item callables once, outside the loop
+        vague_search = _VAGUE_RE.search
+        verifiable_search = _VERIFIABLE_RE.search
+        add_domain = domains.add
         for assumption in assumptions:
-            description = assumption.get("description", "").lower()
-            if not any(word in description for word in vague_words):
+            raw_description: str = assumption.get("description", "")
+            description = raw_description.lower()
+
+            # 1. Specificity: Avoid vague language
+            if not vague_search(description):
                 specific_count += 1
-        scores['specificity'] = (specific_count / len(assumptions)) * 10
 
-        # 2. Verifiability: Can be fact-checked
-        # Look for quantifiable/measurable statements
-        verifiable_patterns = [
-            r'\d+%',  # Percentages
-            r'\$\d+',  # Dollar amounts
-            r'\d+\s*(year|month|day|week)',  # Time periods
-            r'(increase|decrease|grow|shrink|rise|fall)',  # Change verbs
-        ]
-        verifiable_count = 0
-        for assumption in assumptions:
-            description = assumption.get("description", "").lower()
-            if any(re.search(pattern, description) for pattern in verifiable_patterns):
+            # 2. Verifiability: Can be fact-checked
+            # Look for quantifiable/measurable statements
+            if verifiable_search(description):
                 verifiable_count += 1
-        scores['verifiability'] = (verifiable_count / len(assumptions)) * 10
 
-        # 3. Completeness: Cover multiple domains
-        domains = set(a.get("domain", "") for a in assumptions)
-        expected_domains = {'political', 'economic', 'operational', 'social',
-                           'technical', 'environmental'}
-        domain_coverage = len(domains & expected_domains) / len(expected_domains)
-        scores['completeness'] = domain_coverage * 10
+            # 3. Completeness: Cover multiple domains
+            add_domain(assumption.get("domain", ""))
 
-        # 4. Accuracy: Well-formed with required fields
-        accurate_count = sum(
-            1 for a in assumptions
-            if all(key in a for key in ['description', 'domain', 'confidence'])
-            and len(a.get('description', '')) > 20  # Substantive description
-        )
+            # 4. Accuracy: Well-formed with required fields
+            # (an absent description reads as '' and fails the length check)
+            if (len(raw_description) > 20  # Substantive description
+                    and 'domain' in assumption and 'confidence' in assumption):
+                accurate_count += 1
+
+        scores['specificity'] = (specific_count / len(assumptions)) * 10
+        scores['verifiability'] = (verifiable_count / len(assumptions)) * 10
+        domain_coverage = len(domains & _EXPECTED_DOMAINS) / len(_EXPECTED_DOMAINS)
+        scores['completeness'] = domain_coverage * 10
         scores['accuracy'] = (accurate_count / len(assumptions)) * 10
 
         overall_score = sum(scores.values()) / len(scores)
         return round(overall_score, 2)
 
+    @staticmethod
+    def evaluate_batch(assumption_sets: List[List[Dict[str, Any]]],
+                       max_workers: Optional[int] = None) -> List[float]:
+        """
+        Score many independent assumption sets (e.g. one per scenario),
+        fanning out across processes for large batches. Results are in input
+        order and identical to calling evaluate_assumptions on each set.
+        """
+        if len(assumption_sets) < _PARALLEL_MIN_BATCH:
+            return [QualityRubric.evaluate_assumptions(a) for a in assumption_sets]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(QualityRubric.evaluate_assumptions,
+                                     assumption_sets, chunksize=8))
+
     @staticmethod
     def evaluate_questions(questions: List[Dict[str, Any]]) -> float:
         """
@@ -77,49 +173,46 @@ class QualityRubric:
         if not questions:
             return 0.0
 
-        scores = {
+        scores: Dict[str, float] = {
             'depth': 0.0,
             'coverage': 0.0,
             'relevance': 0.0,
             'actionability': 0.0
         }
 
-        # 1. Depth: Deep probing vs surface questions
-        deep_indicators = ['why', 'how', 'what if', 'under what conditions',
-                          'what would happen', 'what prevents', 'what enables']
+        # Single pass over questions, accumulating all four metrics
         deep_count = 0
+        linked_count = 0
+        actionable_count = 0
+        dimensions: Set[str] = set()
+        # Resolve the per-item callables once, outside the loop
+        deep_search = _DEEP_RE.search
+        actionable_search = _ACTIONABLE_RE.search
+        add_dimension = dimensions.add
         for question in questions:
-            text = question.get("text", "").lower()
-            if any(indicator in text for indicator in deep_indicators):
+            text: str = question.get("text", "").lower()
+
+            # 1. Depth: Deep probing vs surface questions
+            if deep_search(text):
                 deep_count += 1
-        scores['depth'] = (deep_count / len(questions)) * 10
 
-        # 2. Coverage: Multiple questioning dimensions
-        dimensions = set(q.get("dimension", "") for q in questions)
-        expected_dimensions = {'temporal', 'structural', 'actor', 'resource',
-                              'information'}
-        dimension_coverage = len(dimensions & expected_dimensions) / len(expected_dimensions)
-        scores['coverage'] = dimension_coverage * 10
+            # 2. Coverage: Multiple questioning dimensions
+            add_dimension(question.get("dimension", ""))
 
-        # 3. Relevance: Questions challenge assumptions
-        # Look for assumption linkage
-        linked_count = sum(
-            1 for q in questions
-            if 'assumption_id' in q or 'related_assumption' in q
-        )
-        scores['relevance'] = (linked_count / len(questions)) * 10
+            # 3. Relevance: Questions challenge assumptions
+            # Look for assumption linkage
+            if 'assumption_id' in question or 'related_assumption' in question:
+                linked_count += 1
 
-        # 4. Actionability: Questions that lead to insights
-        # Look for consequence-focused questions
-        actionable_patterns = [
-            'impact', 'effect', 'consequence', 'result', 'outcome',
-            'change', 'alter', 'affect', 'influence'
-        ]
-        actionable_count = 0
-        for question in questions:
-            text = question.get("text", "").lower()
-            if any(pattern in text for pattern in actionable_patterns):
+            # 4. Actionability: Questions that lead to insights
+            # Look for consequence-focused questions
+            if actionable_search(text):
                 actionable_count += 1
+
+        scores['depth'] = (deep_count / len(questions)) * 10
+        dimension_coverage = len(dimensions & _EXPECTED_DIMENSIONS) / len(_EXPECTED_DIMENSIONS)
+        scores['coverage'] = dimension_coverage * 10
+        scores['relevance'] = (linked_count / len(questions)) * 10
         scores['actionability'] = (actionable_count / len(questions)) * 10
 
         overall_score = sum(scores.values()) / len(scores)
@@ -134,43 +227,49 @@ class QualityRubric:
         if not counterfactuals:
             return 0.0
 
-        scores = {
+        scores: Dict[str, float] = {
             'plausibility': 0.0,
             'specificity': 0.0,
             'consequences': 0.0,
             'diversity': 0.0
         }
 
-        # 1. Plausibility: Realistic breach conditions
-        # Look for conditional language and realistic triggers
-        plausible_indicators = ['if', 'when', 'given', 'assuming', 'should',
-                               'were to', 'in case of']
+        # Single pass over counterfactuals, accumulating all four metrics
         plausible_count = 0
+        specific_count = 0
+        consequence_count = 0
+        # The consequences score caps at an average of 3; once the running
+        # total reaches that, further counts cannot change the score
+        consequence_cap = 3 * len(counterfactuals)
+        axes: Set[str] = set()
+        # Resolve the per-item callables once, outside the loop
+        plausible_search = _PLAUSIBLE_RE.search
+        add_axis = axes.add
         for cf in counterfactuals:
-            breach = cf.get("breach_condition", "").lower()
-            if any(indicator in breach for indicator in plausible_indicators):
+            breach: str = cf.get("breach_condition", "")
+
+            # 1. Plausibility: Realistic breach conditions
+            # Look for conditional language and realistic triggers
+            if plausible_search(breach.lower()):
                 plausible_count += 1
-        scores['plausibility'] = (plausible_count / len(counterfactuals)) * 10
 
-        # 2. Specificity: Detailed breach conditions (>10 words minimum)
-        specific_count = sum(
-            1 for cf in counterfactuals
-            if len(cf.get("breach_condition", "").split()) >= 10
-        )
-        scores['specificity'] = (specific_count / len(counterfactuals)) * 10
+            # 2. Specificity: Detailed breach conditions (>10 words minimum)
+            if _has_min_words(breach):
+                specific_count += 1
+
+            # 3. Consequences: Multiple cascading effects
+            if consequence_count < consequence_cap:
+                consequence_count += len(cf.get("consequences", []))
+
+            # 4. Diversity: Cover different strategic axes
+            add_axis(cf.get("axis", ""))
 
-        # 3. Consequences: Multiple cascading effects
-        avg_consequence_count = sum(
-            len(cf.get("consequences", [])) for cf in counterfactuals
-        ) / len(counterfactuals)
+        scores['plausibility'] = (plausible_count / len(counterfactuals)) * 10
+        scores['specificity'] = (specific_count / len(counterfactuals)) * 10
+        avg_consequence_count = consequence_count / len(counterfactuals)
         # Normalize: 3+ consequences = full score
         scores['consequences'] = min((avg_consequence_count / 3) * 10, 10)
-
-        # 4. Diversity: Cover different strategic axes
-        axes = set(cf.get("axis", "") for cf in counterfactuals)
-        expected_axes = {'escalation', 'containment', 'diplomatic',
-                        'economic', 'internal', 'wildcard'}
-        axis_coverage = len(axes & expected_axes) / len(expected_axes)
+        axis_coverage = len(axes & _EXPECTED_AXES) / len(_EXPECTED_AXES)
         scores['diversity'] = axis_coverage * 10
 
         overall_score = sum(scores.values()) / len(scores)
@@ -185,38 +284,40 @@ class QualityRubric:
         if not trajectories:
             return 0.0
 
-        scores = {
+        scores: Dict[str, float] = {
             'coherence': 0.0,
             'quantification': 0.0,
             'timeline': 0.0,
             'decision_points': 0.0
         }
 
-        # 1. Coherence: Logical progression
-        coherent_count = sum(
-            1 for traj in trajectories
-            if 'description' in traj and len(traj.get('description', '')) > 50
-        )
-        scores['coherence'] = (coherent_count / len(trajectories)) * 10
+        # Single pass over trajectories, accumulating all four metrics
+        coherent_count = 0
+        quantified_count = 0
+        timeline_count = 0
+        decision_count = 0
+        # The decision-point score caps at an average of 2 (see consequences)
+        decision_cap = 2 * len(trajectories)
+        for traj in trajectories:
+            # 1. Coherence: Logical progression
+            if len(traj.get('description', '')) > 50:
+                coherent_count += 1
+
+            # 2. Quantification: Probability and severity scores present
+            if 'probability' in traj and 'severity' in traj and 'confidence' in traj:
+                quantified_count += 1
+
+            # 3. Timeline: Temporal progression defined
+            if 'timeline' in traj or 'timeframe' in traj:
+                timeline_count += 1
+
+            # 4. Decision Points: Intervention opportunities identified
+            if decision_count < decision_cap:
+                decision_count += len(traj.get('decision_points', []))
 
-        # 2. Quantification: Probability and severity scores present
-        quantified_count = sum(
-            1 for traj in trajectories
-            if all(key in traj for key in ['probability', 'severity', 'confidence'])
-        )
+        scores['coherence'] = (coherent_count / len(trajectories)) * 10
         scores['quantification'] = (quantified_count / len(trajectories)) * 10
-
-        # 3. Timeline: Temporal progression defined
-        timeline_count = sum(
-            1 for traj in trajectories
-            if 'timeline' in traj or 'timeframe' in traj
-        )
         scores['timeline'] = (timeline_count / len(trajectories)) * 10
-
-        # 4. Decision Points: Intervention opportunities identified
-        decision_count = sum(
-            len(traj.get('decision_points', [])) for traj in trajectories
-        )
         avg_decisions = decision_count / len(trajectories)
         # Normalize: 2+ decision points = full score
         scores['decision_points'] = min((avg_decisions / 2) * 10, 10)
@@ -225,11 +326,62 @@ class QualityRubric:
         return round(overall_score, 2)
 
 
+# Per-scenario rubric scores, keyed by (scenario id, digest of the scored
+# result sections) (see evaluate_scenario)
+_SCENARIO_SCORES: Dict[Tuple[str, str], Dict[str, float]] = {}
+
+# Result sections scored by evaluate_scenario -> rubric evaluator
+_SECTION_EVALUATORS = {
+    'assumptions': QualityRubric.evaluate_assumptions,
+    'questions': QualityRubric.evaluate_questions,
+    'counterfactuals': QualityRubric.evaluate_counterfactuals,
+    'trajectories': QualityRubric.evaluate_trajectories,
+}
+
+
+def _results_digest(results: Dict[str, Any]) -> str:
+    """Stable digest of the result sections evaluate_scenario scores"""
+    scored = {section: results[section]
+              for section in _SECTION_EVALUATORS if section in results}
+    payload = json.dumps(scored, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def evaluate_scenario(scenario_id: str, results: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Score every section present in a scenario's results, memoized.
+
+    Scores are cached per scenario id and content of the scored sections,
+    so repeat evaluations of the same outputs (e.g. across parametrized
+    tests) skip rescanning, while re-generated outputs for the same id are
+    scored afresh.
+    """
+    key = (scenario_id, _results_digest(results))
+    scores = _SCENARIO_SCORES.get(key)
+    if scores is None:
+        scores = {
+            section: evaluate(results[section])
+            for section, evaluate in _SECTION_EVALUATORS.items()
+            if section in results
+        }
+        _SCENARIO_SCORES[key] = scores
+    return dict(scores)
+
+
+def clear_scenario_scores() -> None:
+    """Drop all memoized evaluate_scenario results"""
+    _SCENARIO_SCORES.clear()
+
+
+# Rating questions (q1-q3) -> row in the aggregate_reviews ratings array
+_RATING_ROWS = {'q1': 0, 'q2': 1, 'q3': 2}
+
+
 class ExpertReview:
     """Human expert review integration"""
 
     @staticmethod
-    def create_review_form(scenario_id: str, results: Dict[str, Any]) -> Dict:
+    def create_review_form(scenario_id: str, results: Dict[str, Any]) -> Dict[str, Any]:
         """Generate expert review form"""
         return {
             'scenario_id': scenario_id,
@@ -277,41 +429,43 @@ class ExpertReview:
         }
 
     @staticmethod
-    def aggregate_reviews(reviews: List[Dict]) -> Dict:
+    def aggregate_reviews(reviews: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Compile expert feedback into summary statistics"""
         if not reviews:
             return {'error': 'No reviews to aggregate'}
 
-        ratings = {
-            'q1_assumption_quality': [],
-            'q2_question_quality': [],
-            'q3_counterfactual_quality': []
-        }
+        # One preallocated row per rated question, sized for the worst case
+        # (every answer is a rating for that question); counts track the fill.
+        capacity = sum(len(review.get('answers', [])) for review in reviews)
+        ratings = np.empty((len(_RATING_ROWS), capacity), dtype=np.float64)
+        counts = [0] * len(_RATING_ROWS)
 
-        insights = []
-        improvements = []
+        insights: List[str] = []
+        improvements: List[str] = []
+        text_sinks = {'q4': insights.append, 'q5': improvements.append}
 
         for review in reviews:
             for answer in review.get('answers', []):
-                if answer['question_id'] == 'q1':
-                    ratings['q1_assumption_quality'].append(answer['rating'])
-                elif answer['question_id'] == 'q2':
-                    ratings['q2_question_quality'].append(answer['rating'])
-                elif answer['question_id'] == 'q3':
-                    ratings['q3_counterfactual_quality'].append(answer['rating'])
-                elif answer['question_id'] == 'q4':
-                    insights.append(answer['text'])
-                elif answer['question_id'] == 'q5':
-                    improvements.append(answer['text'])
+                question_id = answer['question_id']
+                row = _RATING_ROWS.get(question_id)
+                if row is not None:
+                    ratings[row, counts[row]] = answer['rating']
+                    counts[row] += 1
+                else:
+                    sink = text_sinks.get(question_id)
+                    if sink is not None:
+                        sink(answer['text'])
+
+        sum1, sum2, sum3 = (float(ratings[row, :count].sum())
+                            for row, count in enumerate(counts))
+        n1, n2, n3 = counts
 
         return {
             'expert_count': len(reviews),
-            'avg_assumption_rating': sum(ratings['q1_assumption_quality']) / len(ratings['q1_assumption_quality']),
-            'avg_question_rating': sum(ratings['q2_question_quality']) / len(ratings['q2_question_quality']),
-            'avg_counterfactual_rating': sum(ratings['q3_counterfactual_quality']) / len(ratings['q3_counterfactual_quality']),
-            'overall_satisfaction': sum(
-                sum(v) for v in ratings.values()
-            ) / sum(len(v) for v in ratings.values()),
+            'avg_assumption_rating': sum1 / n1,
+            'avg_question_rating': sum2 / n2,
+            'avg_counterfactual_rating': sum3 / n3,
+            'overall_satisfaction': (sum1 + sum2 + sum3) / (n1 + n2 + n3),
             'qualitative_insights': insights,
             'suggested_improvements': improvements
         }
@@ -0,0 +1,82 @@
+"""
+Unit tests for the quality rubric helpers.
+Tests scenario score memoization and batch assumption scoring (in-process and process pool).
+"""
+import pytest
+
+import tests.quality_rubrics as quality_rubrics
+from tests.quality_rubrics import QualityRubric, clear_scenario_scores, evaluate_scenario
+
+
+ASSUMPTIONS = [
+    {"description": "Markets assume 3% annual GDP growth will continue", "domain": "economic", "confidence": 0.7},
+    {"description": "Supply chains can be rapidly rerouted", "domain": "operational", "confidence": 0.5},
+]
+
+QUESTIONS = [
+    {"text": "What would happen if growth stalled?", "dimension": "temporal", "assumption_id": "a1"},
+]
+
+
+class TestEvaluateScenario:
+    """Test memoized per-scenario scoring."""
+
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self):
+        clear_scenario_scores()
+        yield
+        clear_scenario_scores()
+
+    def test_scores_each_present_section(self):
+        """Test that only the sections present are scored."""
+        scores = evaluate_scenario("geo_001", {"assumptions": ASSUMPTIONS, "questions": QUESTIONS})
+
+        assert scores == {
+            "assumptions": QualityRubric.evaluate_assumptions(ASSUMPTIONS),
+            "questions": QualityRubric.evaluate_questions(QUESTIONS),
+        }
+
+    def test_cache_hit_miss_and_clear(self, monkeypatch):
+        """Test that identical outputs hit the cache and changed outputs miss it."""
+        calls = []
+
+        def counting_evaluate(assumptions):
+            calls.append(assumptions)
+            return QualityRubric.evaluate_assumptions(assumptions)
+
+        monkeypatch.setitem(quality_rubrics._SECTION_EVALUATORS, "assumptions", counting_evaluate)
+
+        first = evaluate_scenario("geo_001", {"assumptions": ASSUMPTIONS})
+        # Hit: same id, equal outputs
+        assert evaluate_scenario("geo_001", {"assumptions": [dict(a) for a in ASSUMPTIONS]}) == first
+        assert len(calls) == 1
+
+        # Miss: same id, re-generated outputs
+        changed = evaluate_scenario("geo_001", {"assumptions": ASSUMPTIONS[:1]})
+        assert len(calls) == 2
+        assert changed == {"assumptions": QualityRubric.evaluate_assumptions(ASSUMPTIONS[:1])}
+
+        # Cleared cache rescores
+        clear_scenario_scores()
+        assert evaluate_scenario("geo_001", {"assumptions": ASSUMPTIONS}) == first
+        assert len(calls) == 3
+
+
+class TestEvaluateBatch:
+    """Test batch assumption scoring."""
+
+    ASSUMPTION_SETS = [ASSUMPTIONS, ASSUMPTIONS[:1], [], ASSUMPTIONS * 3]
+
+    def test_in_process_batch_matches_per_set_scores(self):
+        """Test that small batches score each set like evaluate_assumptions."""
+        assert QualityRubric.evaluate_batch(self.ASSUMPTION_SETS) == [
+            QualityRubric.evaluate_assumptions(a) for a in self.ASSUMPTION_SETS
+        ]
+
+    def test_process_pool_batch_matches_per_set_scores(self, monkeypatch):
+        """Test that the process-pool branch keeps input order and scores."""
+        monkeypatch.setattr(quality_rubrics, "_PARALLEL_MIN_BATCH", 2)
+
+        assert QualityRubric.evaluate_batch(self.ASSUMPTION_SETS, max_workers=2) == [
+            QualityRubric.evaluate_assumptions(a) for a in self.ASSUMPTION_SETS
+        ]
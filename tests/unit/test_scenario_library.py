@@ -0,0 +1,27 @@
+"""
+Unit tests for the high-stakes scenario library.
+Tests scenario lookup and the numeric metrics view.
+"""
+import tests.test_scenarios as scenario_library
+from tests.test_scenarios import get_scenario
+
+
+def test_get_scenario_by_id():
+    """Test that get_scenario returns the scenario with that id."""
+    scenario = get_scenario("geo_001")
+
+    assert scenario.id == "geo_001"
+    assert scenario.domain == "geopolitical"
+    assert scenario in scenario_library.GEOPOLITICAL_SCENARIOS
+
+
+def test_scenario_metrics_align_with_all_scenarios():
+    """Test that metric rows line up with ALL_SCENARIOS and sums match."""
+    metrics = scenario_library.SCENARIO_METRICS
+    scenarios = scenario_library.ALL_SCENARIOS
+
+    assert len(metrics) == len(scenarios)
+    assert metrics["expected_assumptions"].tolist() == [s.expected_assumptions for s in scenarios]
+    assert metrics["expected_fragilities"].tolist() == [s.expected_fragilities for s in scenarios]
+    assert int(metrics["expected_assumptions"].sum()) == sum(s.expected_assumptions for s in scenarios)
+    assert int(metrics["expected_fragilities"].sum()) == sum(s.expected_fragilities for s in scenarios)